@@ -28,12 +28,20 @@ What it does
 
 Requirements
 ------------
-Python 3.8+  •  pip install requests pillow
+Python 3.8+  •  pip install requests pillow numpy
+Optional: pip install orjson (faster parsing of the IMDb suggestion feed)
+Optional (x86): pip uninstall pillow && pip install pillow-simd
+          Drop-in Pillow build with SSE4/AVX2 decode, resize and convert — same API,
+          several times faster on the image-scoring path. Install one or the other,
+          never both.
 
 Notes
 -----
 • Searches hit public HTML pages (no APIs). If rate‑limited, try again later.
 • Respect licenses if reusing images publicly.
+• IMDb suggestions, probed image sizes, image colours and downloads are cached
+  for 7 days in ~/.cache/movie-image-fetcher/ (cache.db + objects/); saved images
+  are hardlinks into objects/. Delete the folder to force fresh lookups.
 """
 
 import io
@@ -42,11 +50,32 @@ import sys
 import os
 import math
 import html
+import json
+import time
+import socket
+import shutil
+import sqlite3
+import struct
+import functools
+import hashlib
+import itertools
+import tempfile
+import threading
 import urllib.parse
-from typing import List, Optional, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
 
+import numpy as np
 import requests
 from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 UA = {"User-Agent": "MovieImageFetcher/AnySource/1.1 (no-api-key)"}
 TIMEOUT = 45
@@ -54,12 +83,44 @@ TIMEOUT = 45
 MIN_POSTER_HEIGHT = 2000        # keep posters high-res
 MIN_LANDSCAPE_WIDTH = 1280      # Lowered from 1920 to 1280 (720p)
 TARGET_AR = 16/9
+LAB_SAMPLE_SIZE = (16, 16)      # thumbnail averaged for colour matching
+LAB_VERSION = 2                 # bump when avg_color_lab's method changes; invalidates cached colours
+
+DOWNLOAD_CHUNK = 65536
+SPOOL_MAX_BYTES = 1 << 20       # candidate images larger than this spill to a temp file
+PROBE_BYTES = 8192              # first ranged probe; JPEG SOF / PNG IHDR normally sit well inside it
+PROBE_MAX_BYTES = 65536         # follow-up range when EXIF/ICC blocks push the header further out
+HEADER_MAX_BYTES = 1 << 20      # fallback size sniffing gives up past this; no real header is that long
+PROBE_WORKERS = 5               # concurrent candidate probes; keep low to stay polite to CDNs
+LANDSCAPE_WORKERS = 16          # landscape candidates are spread across many unrelated hosts
+TMDB_IMAGE_HOST = "image.tmdb.org"
+TMDB_ENOUGH = 3                 # this many TMDB backdrops and the search engines are skipped
+TMDB_BONUS = 0.2                # score bonus for TMDB backdrops (lower score is better)
+
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "movie-image-fetcher", "cache.db")
+CACHE_TTL = 7 * 24 * 3600       # seconds before cached suggestions/probes are revalidated
+STORE_DIR = os.path.join(os.path.dirname(CACHE_PATH), "objects")   # downloaded images, by content hash
+STALE_PART_AGE = 3600           # seconds before an unfinished .part in the store counts as abandoned
+
+T = TypeVar("T")
 
 # ----------------------------- utilities ------------------------------------
 
+_ILLEGAL_FN = re.compile(r"[\\/:*?\"<>|]")
+_WS = re.compile(r"\s+")
+_TRAILING_PAREN = re.compile(r"\s+\(.*?\)$")      # "Title (2019)" -> "Title"
+_NON_SLUG = re.compile(r"[^\w\s-]")
+_EXTS = {"jpg", "jpeg", "png", "webp"}
+
+
+def loads_json(data: Union[bytes, str]):
+    # orjson parses straight from bytes, skipping the str decode json.loads needs
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 def sanitize_filename(name: str) -> str:
-    name = re.sub(r"[\\/:*?\"<>|]", "", name)
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _ILLEGAL_FN.sub("", name)
+    name = _WS.sub(" ", name).strip()
     return name
 
 
@@ -69,23 +130,463 @@ def infer_ext(url: str, content_type: Optional[str]) -> str:
         if "png" in ct: return ".png"
         if "webp" in ct: return ".webp"
         if "jpeg" in ct or "jpg" in ct: return ".jpg"
-    m = re.search(r"\.(jpe?g|png|webp)(?:\?|$)", url, flags=re.I)
-    return f".{m.group(1).lower()}" if m else ".jpg"
+    # Runs per candidate URL; a split and a set lookup beat a regex search
+    _, dot, ext = url.split("?", 1)[0].rpartition(".")
+    ext = ext.lower()
+    if not dot or ext not in _EXTS or ext == "jpeg":
+        return ".jpg"
+    return f".{ext}"
+
+
+# One shared session so repeat requests to the same host reuse kept-alive connections.
+# pool_maxsize covers every concurrent probe/download thread hitting a single host,
+# so no connection is opened just to be thrown away when the pool is full.
+SESSION = requests.Session()
+SESSION.headers.update(UA)
+# Only connect/read failures are retried here; status-based backoff (429/503 with
+# Retry-After) is left to AdaptiveThrottle, which urllib3 would otherwise bypass
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                       max_retries=Retry(total=2, status=0, backoff_factor=0.3, respect_retry_after_header=False))
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+
+# Hosts every run talks to (IMDb suggestions + poster CDN)
+KNOWN_HOSTS = ("v2.sg.media-imdb.com", "m.media-amazon.com")
+
+
+def prewarm_dns(hosts=KNOWN_HOSTS) -> None:
+    """Resolve ``hosts`` in the background so the first real request finds DNS already cached.
+
+    requests has no pluggable resolver, so this warms the OS resolver cache; after
+    that the pooled keep-alive connections in ``SESSION`` avoid lookups entirely.
+    """
+    def resolve(host: str) -> None:
+        try:
+            socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+        except OSError:
+            pass
+    for host in hosts:
+        threading.Thread(target=resolve, args=(host,), daemon=True).start()
+
+
+class AdaptiveThrottle:
+    """Per-host exponential backoff after consecutive 403/429 responses.
+
+    Search engines answer scraping bursts with 403/429 and escalate to a ban if the
+    requests keep coming; backing off keeps later queries in the run usable.
+    """
+
+    def __init__(self, base_delay: float = 1.0, max_delay: float = 30.0):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._strikes: dict = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host: str) -> None:
+        with self._lock:
+            strikes = self._strikes.get(host, 0)
+        if strikes:
+            time.sleep(min(self.max_delay, self.base_delay * 2 ** (strikes - 1)))
+
+    def record(self, host: str, status: int) -> None:
+        with self._lock:
+            if status in (403, 429):
+                self._strikes[host] = self._strikes.get(host, 0) + 1
+            else:
+                self._strikes.pop(host, None)
+
+
+SEARCH_THROTTLE = AdaptiveThrottle()
 
 
-def get(url: str, stream: bool = True, timeout: int = TIMEOUT) -> requests.Response:
-    r = requests.get(url, headers=UA, stream=stream, timeout=timeout)
+def get(url: str, stream: bool = True, timeout: int = TIMEOUT, headers: Optional[dict] = None, throttle: bool = False) -> requests.Response:
+    host = urllib.parse.urlsplit(url).hostname or ""
+    if throttle:
+        SEARCH_THROTTLE.wait(host)
+    r = SESSION.get(url, headers=headers, stream=stream, timeout=timeout)
+    if throttle:
+        SEARCH_THROTTLE.record(host, r.status_code)
     r.raise_for_status()
     return r
 
 
-def fetch_image_and_dims(url: str) -> Tuple[bytes, int, int, str]:
-    r = get(url, stream=True)
-    data = r.content
-    ct = r.headers.get("Content-Type", "")
-    with Image.open(io.BytesIO(data)) as im:
-        w, h = im.size
-    return data, w, h, ct
+# The bytes a ranged probe already received, so downloading a winning candidate
+# resumes from there instead of fetching its header twice. Bounded: only the most
+# recent probes are worth keeping.
+_PREFIX_SLOTS = 32
+_prefixes: "OrderedDict[str, Tuple[bytes, Optional[str]]]" = OrderedDict()
+_prefix_lock = threading.Lock()
+
+
+def _remember_prefix(url: str, data: bytes, etag: Optional[str]) -> None:
+    with _prefix_lock:
+        _prefixes[url] = (bytes(data), etag)
+        _prefixes.move_to_end(url)
+        while len(_prefixes) > _PREFIX_SLOTS:
+            _prefixes.popitem(last=False)
+
+
+def _take_prefix(url: str) -> Tuple[bytes, Optional[str]]:
+    with _prefix_lock:
+        return _prefixes.pop(url, (b"", None))
+
+
+_store_swept = False
+
+
+def _store_dir() -> str:
+    """Create ``STORE_DIR`` if needed; on first use, drop ``.part`` files a killed run left behind.
+
+    Only parts untouched for ``STALE_PART_AGE`` go, so a concurrent run's download is safe.
+    """
+    global _store_swept
+    os.makedirs(STORE_DIR, exist_ok=True)
+    if not _store_swept:
+        _store_swept = True
+        cutoff = time.time() - STALE_PART_AGE
+        for name in os.listdir(STORE_DIR):
+            part = os.path.join(STORE_DIR, name)
+            try:
+                if name.endswith(".part") and os.path.getmtime(part) < cutoff:
+                    os.remove(part)
+            except OSError:
+                pass
+    return STORE_DIR
+
+
+def _place(obj: str, path: str) -> None:
+    """Hardlink store object ``obj`` to ``path``, copying if the filesystem can't link."""
+    if os.path.lexists(path):
+        os.remove(path)
+    try:
+        os.link(obj, path)
+    except OSError:
+        shutil.copyfile(obj, path)
+
+
+def open_body(url: str) -> Tuple[requests.Response, bytes]:
+    """Start a streaming download of ``url``; returns ``(response, head)``.
+
+    ``head`` is whatever a ranged probe already received (empty if nothing was
+    kept); the caller writes it before the response's chunks to get the full body.
+    """
+    # If-Range makes the server send the whole image instead if it changed since
+    prefix, etag = _take_prefix(url)
+    headers = {}
+    if prefix:
+        headers["Range"] = f"bytes={len(prefix)}-"
+        if etag:
+            headers["If-Range"] = etag
+    r = get(url, stream=True, headers=headers)
+    if not prefix or r.status_code != 206:
+        return r, b""
+    if not r.headers.get("Content-Range", "").startswith(f"bytes {len(prefix)}-"):
+        r.close()
+        raise ValueError(f"unexpected Content-Range {r.headers.get('Content-Range')!r}")
+    return r, prefix
+
+
+def fetch_to_spool(url: str) -> Tuple[BinaryIO, str]:
+    """Download ``url`` into a temp file that only stays in memory while small.
+
+    Returns ``(file, content_type)`` with the file rewound; close it when done.
+    """
+    r, head = open_body(url)
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    with r:
+        try:
+            spool.write(head)
+            for chunk in r.iter_content(DOWNLOAD_CHUNK):
+                spool.write(chunk)
+        except BaseException:
+            spool.close()
+            raise
+    spool.seek(0)
+    return spool, r.headers.get("Content-Type", "")
+
+
+def download_to(url: str, dest_stem: str) -> Tuple[str, str]:
+    """Stream ``url`` to ``dest_stem`` + its inferred extension; returns ``(path, ext)``.
+
+    The body goes straight to disk in chunks, so the image is never held in memory.
+    Files land in a content-addressed store (``STORE_DIR/<blake2b><ext>``) that the
+    destination is hardlinked to: identical images are stored once, and a URL that
+    was downloaded before is placed again without any request.
+    """
+    row = cache_query("SELECT digest, ext FROM downloads WHERE url = ? AND ts > ?", (url, int(time.time()) - CACHE_TTL))
+    if row and os.path.exists(os.path.join(STORE_DIR, row[0] + row[1])):
+        path = dest_stem + row[1]
+        _place(os.path.join(STORE_DIR, row[0] + row[1]), path)
+        return path, row[1]
+
+    r, head = open_body(url)
+    with r:
+        ext = infer_ext(url, r.headers.get("Content-Type"))
+        path = store_chunks(itertools.chain((head,), r.iter_content(DOWNLOAD_CHUNK)), url, ext, dest_stem)
+    return path, ext
+
+
+def store_chunks(chunks: Iterable[bytes], url: str, ext: str, dest_stem: str) -> str:
+    """Write ``chunks`` (the body of ``url``) into the store and place it at ``dest_stem`` + ``ext``.
+
+    Records the download so a later ``download_to(url, ...)`` needs no request;
+    returns the destination path.
+    """
+    store = _store_dir()
+    digest = hashlib.blake2b(digest_size=16)
+    fd, tmp = tempfile.mkstemp(dir=store, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                digest.update(chunk)
+                f.write(chunk)
+        obj = os.path.join(store, digest.hexdigest() + ext)
+        os.replace(tmp, obj)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    cache_write("INSERT OR REPLACE INTO downloads VALUES (?, ?, ?, ?)", (url, digest.hexdigest(), ext, int(time.time())))
+    path = dest_stem + ext
+    _place(obj, path)
+    return path
+
+
+def _jpeg_dims(buf: bytes) -> Optional[Tuple[int, int]]:
+    i, n = 2, len(buf)
+    while i + 4 <= n:
+        if buf[i] != 0xFF:
+            return None
+        marker = buf[i + 1]
+        if marker == 0xFF:                          # fill byte
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:  # standalone markers
+            i += 2
+            continue
+        # SOF0..SOF15, excluding DHT (C4), JPG (C8) and DAC (CC)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            if i + 9 > n:
+                return None
+            h, w = struct.unpack(">HH", buf[i + 5:i + 9])
+            return w, h
+        (length,) = struct.unpack(">H", buf[i + 2:i + 4])
+        i += 2 + length
+    return None
+
+
+def _webp_dims(buf: bytes) -> Optional[Tuple[int, int]]:
+    if len(buf) < 30:
+        return None
+    chunk = buf[12:16]
+    if chunk == b"VP8 " and buf[23:26] == b"\x9d\x01\x2a":
+        w, h = struct.unpack("<HH", buf[26:30])
+        return w & 0x3FFF, h & 0x3FFF
+    if chunk == b"VP8L" and buf[20] == 0x2F:
+        (bits,) = struct.unpack("<I", buf[21:25])
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        w = int.from_bytes(buf[24:27], "little") + 1
+        h = int.from_bytes(buf[27:30], "little") + 1
+        return w, h
+    return None
+
+
+def _bmp_dims(buf: bytes) -> Optional[Tuple[int, int]]:
+    if len(buf) < 26:
+        return None
+    (header_size,) = struct.unpack("<I", buf[14:18])
+    if header_size == 12:                           # OS/2 BITMAPCOREHEADER
+        return struct.unpack("<HH", buf[18:22])
+    w, h = struct.unpack("<ii", buf[18:26])
+    return w, abs(h)                                # negative height = top-down rows
+
+
+def image_dims(buf: bytes) -> Optional[Tuple[int, int]]:
+    """Parse ``(width, height)`` straight from a JPEG/PNG/WebP/GIF/BMP header.
+
+    Returns ``None`` for other formats or when ``buf`` stops before the size field.
+    """
+    if buf[:8] == b"\x89PNG\r\n\x1a\n":
+        if len(buf) >= 24 and buf[12:16] == b"IHDR":
+            return struct.unpack(">II", buf[16:24])
+        return None
+    if buf[:4] == b"RIFF" and buf[8:12] == b"WEBP":
+        return _webp_dims(buf)
+    if buf[:2] == b"\xff\xd8":
+        return _jpeg_dims(buf)
+    if buf[:6] in (b"GIF87a", b"GIF89a"):
+        return struct.unpack("<HH", buf[6:10]) if len(buf) >= 10 else None
+    if buf[:2] == b"BM":
+        return _bmp_dims(buf)
+    return None
+
+
+def fetch_image_and_dims(url: str) -> Tuple[int, int, str]:
+    """Stream ``url`` only until Pillow can read its header; returns ``(w, h, content_type)``.
+
+    Fallback for formats ``image_dims`` doesn't parse. ``Image.open`` is lazy, so
+    no pixels are decoded, and the connection is dropped once the size is known.
+    """
+    buf = bytearray()
+    with get(url, stream=True) as r:
+        ct = r.headers.get("Content-Type", "")
+        # Wallpaper sites often answer a missing image with a 200 HTML page
+        if ct.lower().startswith("text/"):
+            raise ValueError(f"not an image ({ct})")
+        for chunk in r.iter_content(DOWNLOAD_CHUNK):
+            buf += chunk
+            try:
+                with Image.open(io.BytesIO(buf)) as im:
+                    w, h = im.size
+                return w, h, ct
+            except Exception:
+                if len(buf) >= HEADER_MAX_BYTES:
+                    break
+    raise ValueError(f"could not read image size from {url}")
+
+
+def probe_dims(url: str) -> Tuple[int, int, str]:
+    """Read just enough of ``url`` to learn its dimensions, without downloading the body.
+
+    Results (including 404/410 misses) are cached on disk for ``CACHE_TTL`` seconds.
+    """
+    row = cache_query("SELECT status, w, h, ct FROM probes WHERE url = ? AND ts > ?", (url, int(time.time()) - CACHE_TTL))
+    if row:
+        status, w, h, ct = row
+        if status != 200:
+            raise ValueError(f"cached HTTP {status}")
+        return w, h, ct
+    try:
+        w, h, ct, etag = _probe_dims_uncached(url)
+    except requests.HTTPError as e:
+        status = e.response.status_code if e.response is not None else None
+        if status in (404, 410):
+            cache_write("INSERT OR REPLACE INTO probes VALUES (?, ?, NULL, NULL, NULL, NULL, ?)", (url, status, int(time.time())))
+        raise
+    cache_write("INSERT OR REPLACE INTO probes VALUES (?, 200, ?, ?, ?, ?, ?)", (url, w, h, ct, etag, int(time.time())))
+    return w, h, ct
+
+
+def _probe_dims_uncached(url: str) -> Tuple[int, int, str, Optional[str]]:
+    buf = bytearray()
+    dims = None
+    for limit in (PROBE_BYTES, PROBE_MAX_BYTES):
+        r = get(url, stream=True, headers={"Range": f"bytes={len(buf)}-{limit - 1}"})
+        if r.status_code != 206:
+            # Server ignores Range and sends the whole body from byte 0; read only
+            # as far as the header and hang up.
+            buf = bytearray()
+            limit = PROBE_MAX_BYTES
+        try:
+            for chunk in r.iter_content(8192):
+                buf += chunk
+                dims = image_dims(buf)
+                if dims is not None or len(buf) >= limit:
+                    break
+        finally:
+            r.close()
+        total = r.headers.get("Content-Range", "").rpartition("/")[2]
+        if dims is not None or r.status_code != 206 or not total.isdigit() or int(total) <= len(buf):
+            break
+    if dims is None:
+        # Not a JPEG/PNG/WebP (or an unusually long header); let Pillow try the
+        # prefix, and failing that stream the image until its header turns up.
+        try:
+            with Image.open(io.BytesIO(buf)) as im:
+                dims = im.size
+        except Exception:
+            w, h, ct = fetch_image_and_dims(url)
+            return w, h, ct, None
+    w, h = dims
+    etag = r.headers.get("ETag")
+    if r.status_code == 206 and total.isdigit() and int(total) > len(buf):
+        _remember_prefix(url, buf, etag)
+    return w, h, r.headers.get("Content-Type", ""), etag
+
+
+def probe_in_order(urls: List[str], probe: Callable[[str], T], workers: int = PROBE_WORKERS,
+                   skip: Optional[Callable[[str], bool]] = None) -> Iterator[Tuple[str, Optional[T]]]:
+    """Run ``probe`` over ``urls`` concurrently, yielding ``(url, result)`` in input order.
+
+    At most ``workers`` probes run at once and a failed probe yields ``None``.
+    ``skip`` is checked before a URL is submitted and again before its result is
+    yielded, so callers can prune candidates based on what earlier probes found.
+    Stopping iteration early cancels the probes that have not started yet.
+    """
+    pool = ThreadPoolExecutor(max_workers=workers)
+    remaining = (u for u in urls if skip is None or not skip(u))
+    pending = deque((url, pool.submit(probe, url)) for url in itertools.islice(remaining, workers))
+    try:
+        while pending:
+            url, fut = pending.popleft()
+            nxt = next(remaining, None)
+            if nxt is not None:
+                pending.append((nxt, pool.submit(probe, nxt)))
+            if skip is not None and skip(url):
+                fut.cancel()
+                continue
+            try:
+                result = fut.result()
+            except Exception:
+                result = None
+            yield url, result
+    finally:
+        for _, fut in pending:
+            fut.cancel()
+        pool.shutdown(wait=False)
+
+# ------------------------------- disk cache ---------------------------------
+
+# Suggestion responses, probed dimensions and image colours survive between runs, so re-running a
+# title skips the network for everything that was already looked up. Any cache
+# failure just means a cache miss.
+
+_cache_conn: Optional[sqlite3.Connection] = None
+_cache_lock = threading.Lock()
+
+
+def _cache() -> Optional[sqlite3.Connection]:
+    global _cache_conn
+    if _cache_conn is None:
+        try:
+            os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+            conn = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+            conn.executescript(
+                "CREATE TABLE IF NOT EXISTS probes (url TEXT PRIMARY KEY, status INT, w INT, h INT, ct TEXT, etag TEXT, ts INT);"
+                "CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, body TEXT, etag TEXT, last_modified TEXT, ts INT);"
+                "CREATE TABLE IF NOT EXISTS downloads (url TEXT PRIMARY KEY, digest TEXT, ext TEXT, ts INT);"
+                "CREATE TABLE IF NOT EXISTS colors (digest TEXT PRIMARY KEY, l REAL, a REAL, b REAL, ts INT);"
+                "CREATE TABLE IF NOT EXISTS variants (tconst TEXT PRIMARY KEY, token TEXT, ts INT);"
+            )
+            _cache_conn = conn
+        except (OSError, sqlite3.Error):
+            return None
+    return _cache_conn
+
+
+def cache_query(sql: str, args: tuple = ()) -> Optional[tuple]:
+    with _cache_lock:
+        conn = _cache()
+        if conn is None:
+            return None
+        try:
+            return conn.execute(sql, args).fetchone()
+        except sqlite3.Error:
+            return None
+
+
+def cache_write(sql: str, args: tuple = ()) -> None:
+    with _cache_lock:
+        conn = _cache()
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.execute(sql, args)
+        except sqlite3.Error:
+            pass
 
 # ----------------------------- color utils ----------------------------------
 
@@ -96,41 +597,78 @@ def srgb_to_linear(c: float) -> float:
     return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
 
 
-def rgb_to_xyz(r: int, g: int, b: int) -> Tuple[float, float, float]:
-    R = srgb_to_linear(r)
-    G = srgb_to_linear(g)
-    B = srgb_to_linear(b)
-    X = R * 0.4124 + G * 0.3576 + B * 0.1805
-    Y = R * 0.2126 + G * 0.7152 + B * 0.0722
-    Z = R * 0.0193 + G * 0.1192 + B * 0.9505
-    return X, Y, Z
+# sRGB byte -> linear light, indexed by pixel value
+_SRGB_LIN_LUT = np.array([srgb_to_linear(i) for i in range(256)], dtype=np.float32)
 
 
-def f_lab(t: float) -> float:
-    eps = 216/24389
-    kappa = 24389/27
-    return t ** (1/3) if t > eps else (kappa * t + 16) / 116
+# Linear sRGB -> XYZ, and the D65 reference white XYZ is normalised by
+_RGB2XYZ = np.array([
+    [0.4124, 0.3576, 0.1805],
+    [0.2126, 0.7152, 0.0722],
+    [0.0193, 0.1192, 0.9505],
+])
+_D65 = np.array([0.95047, 1.00000, 1.08883])
 
 
-def xyz_to_lab(X: float, Y: float, Z: float) -> Tuple[float, float, float]:
-    Xn, Yn, Zn = 0.95047, 1.00000, 1.08883  # D65
-    fx, fy, fz = f_lab(X / Xn), f_lab(Y / Yn), f_lab(Z / Zn)
-    L = 116 * fy - 16
-    a = 500 * (fx - fy)
-    b = 200 * (fy - fz)
-    return L, a, b
+def linear_rgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """Convert linear-light RGB of shape (..., 3) to CIE Lab of the same shape."""
+    t = (rgb @ _RGB2XYZ.T) / _D65
+    eps = 216/24389
+    kappa = 24389/27
+    f = np.where(t > eps, np.cbrt(t), (kappa * t + 16) / 116)
+    fx, fy, fz = f[..., 0], f[..., 1], f[..., 2]
+    return np.stack([116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)], axis=-1)
 
 
-def avg_color_lab(img_bytes: bytes) -> Tuple[float, float, float]:
-    with Image.open(io.BytesIO(img_bytes)) as im:
+def content_digest(src: Union[bytes, str, BinaryIO]) -> str:
+    """blake2b hex digest of raw bytes, a file path or an open file (rewound afterwards)."""
+    if isinstance(src, bytes):
+        return hashlib.blake2b(src, digest_size=16).hexdigest()
+    digest = hashlib.blake2b(digest_size=16)
+    f = open(src, "rb") if isinstance(src, str) else src
+    try:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK), b""):
+            digest.update(chunk)
+    finally:
+        if isinstance(src, str):
+            f.close()
+        else:
+            f.seek(0)
+    return digest.hexdigest()
+
+
+def avg_color_lab(src: Union[bytes, str, BinaryIO]) -> Tuple[float, float, float]:
+    """Average color of an image given as raw bytes, a file path or an open file.
+
+    Results are cached on disk by content hash, so the same image served from
+    different URLs, or seen again on a re-run, is only decoded once.
+    """
+    # The sampling parameters are part of the key, so changing them never reuses old values
+    key = f"{content_digest(src)}:v{LAB_VERSION}:{LAB_SAMPLE_SIZE[0]}x{LAB_SAMPLE_SIZE[1]}"
+    row = cache_query("SELECT l, a, b FROM colors WHERE digest = ? AND ts > ?", (key, int(time.time()) - CACHE_TTL))
+    if row:
+        return row
+    lab = _avg_color_lab_uncached(src)
+    cache_write("INSERT OR REPLACE INTO colors VALUES (?, ?, ?, ?, ?)", (key, *lab, int(time.time())))
+    return lab
+
+
+def _avg_color_lab_uncached(src: Union[bytes, str, BinaryIO]) -> Tuple[float, float, float]:
+    with Image.open(io.BytesIO(src) if isinstance(src, bytes) else src) as im:
+        # For JPEGs, let libjpeg scale during IDCT (up to 1/8) - no point decoding
+        # every pixel of a 4K image just to average it down to 16x16
+        im.draft("RGB", (LAB_SAMPLE_SIZE[0] * 8, LAB_SAMPLE_SIZE[1] * 8))
         im = im.convert("RGB")
-        im = im.resize((64, 64))
-        pixels = list(im.getdata())
-    r = sum(p[0] for p in pixels) / len(pixels)
-    g = sum(p[1] for p in pixels) / len(pixels)
-    b = sum(p[2] for p in pixels) / len(pixels)
-    X, Y, Z = rgb_to_xyz(int(r), int(g), int(b))
-    return xyz_to_lab(X, Y, Z)
+        # BOX is a plain block average - exactly what a mean colour needs, and a
+        # single integer pass instead of a bicubic convolution over every pixel.
+        # draft() only helps JPEGs; for PNG/WebP, reducing_gap first shrinks by an
+        # integer factor with reduce(), which is what Image.thumbnail does too
+        im = im.resize(LAB_SAMPLE_SIZE, Image.BOX, reducing_gap=3.0)
+        # Linearize each pixel before averaging: sRGB is gamma-encoded, so a mean of
+        # the encoded bytes underweights highlights
+        mean_lin = _SRGB_LIN_LUT[np.asarray(im, dtype=np.uint8)].reshape(-1, 3).mean(axis=0, dtype=np.float64)
+    L, a, b = linear_rgb_to_lab(mean_lin).tolist()
+    return L, a, b
 
 
 def delta_e_cie76(lab1: Tuple[float, float, float], lab2: Tuple[float, float, float]) -> float:
@@ -141,16 +679,34 @@ def delta_e_cie76(lab1: Tuple[float, float, float], lab2: Tuple[float, float, fl
 SUGGEST_BASE = "https://v2.sg.media-imdb.com/suggestion/{letter}/{slug}.json"
 
 
+@functools.lru_cache(maxsize=32)
 def imdb_suggest(title: str) -> Optional[dict]:
-    slug = re.sub(r"\s+", "_", title).strip()
+    slug = _WS.sub("_", title).strip()
     if not slug:
         return None
     url = SUGGEST_BASE.format(letter=slug[0].lower(), slug=urllib.parse.quote(slug))
+    row = cache_query("SELECT body, etag, last_modified, ts FROM responses WHERE url = ?", (url,))
+    if row and row[3] > time.time() - CACHE_TTL:
+        return loads_json(row[0])
+    # Stale entries are revalidated; a 304 refreshes the timestamp without a body.
+    headers = {}
+    if row and row[1]:
+        headers["If-None-Match"] = row[1]
+    if row and row[2]:
+        headers["If-Modified-Since"] = row[2]
     try:
-        r = get(url, stream=False)
-        return r.json()
+        r = get(url, stream=False, headers=headers)
+        if r.status_code == 304 and row:
+            cache_write("UPDATE responses SET ts = ? WHERE url = ?", (int(time.time()), url))
+            return loads_json(row[0])
+        js = loads_json(r.content)
+        cache_write(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+            (url, r.text, r.headers.get("ETag"), r.headers.get("Last-Modified"), int(time.time())),
+        )
+        return js
     except Exception:
-        return None
+        return loads_json(row[0]) if row else None
 
 
 def pick_imdb_title(js: dict, query: str) -> Optional[dict]:
@@ -160,7 +716,8 @@ def pick_imdb_title(js: dict, query: str) -> Optional[dict]:
     q = query.lower().strip()
     films = [x for x in items if x.get("id", "").startswith("tt") and (x.get("qid") in ("feature", "movie", "title") or x.get("q") in ("feature", "movie"))]
     if not films:
-        films = items
+        # A copy: items belongs to imdb_suggest's lru_cache'd response, and it's sorted below
+        films = list(items)
     def key(x):
         name = (x.get("l") or "").lower()
         exact = (name == q)
@@ -179,6 +736,15 @@ IMDB_URL_RE = re.compile(
 )
 
 
+_VARIANT_TOKEN = re.compile(r"_(UY|UX)(\d+)_")
+
+
+def variant_token(url: str) -> str:
+    """Resize token of an IMDb variant URL, e.g. ``"UY4000"``; ``""`` for the original."""
+    m = _VARIANT_TOKEN.search(url)
+    return m.group(1) + m.group(2) if m else ""
+
+
 def imdb_hi_res_variants(url: str) -> List[str]:
     m = IMDB_URL_RE.match(url)
     if not m:
@@ -188,112 +754,167 @@ def imdb_hi_res_variants(url: str) -> List[str]:
     qs = m.group("qs") or ""
     heights = [6000, 5000, 4000, 3500, 3000, 2500, 2200, 2000]
     widths  = [6000, 5000, 4000, 3500, 3000, 2500, 2200, 2000]
-    variants: List[str] = []
-    for h in heights:
-        variants.append(f"{prefix}_V1_FMjpg_UY{h}_.{ext}{qs}")
-    for w in widths:
-        variants.append(f"{prefix}_V1_FMjpg_UX{w}_.{ext}{qs}")
-    variants.append(f"{prefix}_V1_.{ext}{qs}")
-    return variants
+    # dict.fromkeys keeps first-seen order and drops repeats if the size lists overlap
+    variants = dict.fromkeys(itertools.chain(
+        (f"{prefix}_V1_FMjpg_UY{h}_.{ext}{qs}" for h in heights),
+        (f"{prefix}_V1_FMjpg_UX{w}_.{ext}{qs}" for w in widths),
+        (f"{prefix}_V1_.{ext}{qs}",),
+    ))
+    return list(variants)
 
 
-def fetch_poster_imdb(title: str, min_height: int = MIN_POSTER_HEIGHT) -> Tuple[Optional[bytes], Optional[str], Optional[Tuple[float,float,float]]]:
+def fetch_poster_imdb(title: str, dest_stem: str, min_height: int = MIN_POSTER_HEIGHT) -> Tuple[Optional[str], Optional[str], Optional[Tuple[float,float,float]]]:
+    """Save the largest acceptable IMDb poster to ``dest_stem`` + ext; returns ``(path, ext, lab)``."""
     js = imdb_suggest(title)
     picked = pick_imdb_title(js, title) if js else None
     img_url = (picked or {}).get("i", {}).get("imageUrl") if picked else None
     if not img_url:
         return None, None, None
-    for url in imdb_hi_res_variants(img_url):
+    tconst = picked.get("id")
+    # Amazon's resizer never upscales: once UY6000 comes back 2400 px tall, every
+    # larger UY target returns the same image, so prune them (same for UX/width).
+    caps = {}
+
+    def beyond_cap(url: str) -> bool:
+        m = _VARIANT_TOKEN.search(url)
+        return bool(m) and int(m.group(2)) > caps.get(m.group(1), math.inf)
+
+    def accept(url: str, result: Tuple[int, int, str]) -> Optional[Tuple[str, str, Tuple[float, float, float]]]:
+        w, h, _ = result
+        m = _VARIANT_TOKEN.search(url)
+        if m:
+            actual = h if m.group(1) == "UY" else w
+            if actual < int(m.group(2)):
+                caps[m.group(1)] = min(actual, caps.get(m.group(1), math.inf))
+        if h < min_height or h <= w:
+            return None
         try:
-            data, w, h, ct = fetch_image_and_dims(url)
-            if h >= min_height and h > w:
-                poster_lab = avg_color_lab(data)
-                ext = infer_ext(url, ct)
-                return data, ext, poster_lab
+            path, ext = download_to(url, dest_stem)
+        except Exception:
+            return None
+        try:
+            poster_lab = avg_color_lab(path)
         except Exception:
+            os.remove(path)
+            return None
+        if tconst:
+            cache_write("INSERT OR REPLACE INTO variants VALUES (?, ?, ?)", (tconst, variant_token(url), int(time.time())))
+        return path, ext, poster_lab
+
+    # The variant that worked last time for this title is tried on its own first
+    variants = imdb_hi_res_variants(img_url)
+    row = cache_query("SELECT token FROM variants WHERE tconst = ?", (tconst,)) if tconst else None
+    for url in (u for u in variants if row and variant_token(u) == row[0]):
+        try:
+            got = accept(url, probe_dims(url))
+        except Exception:
+            got = None
+        if got:
+            return got
+
+    # Variants are ordered largest-first, so probe them concurrently but take the
+    # first acceptable one in that order. Only the winner is downloaded in full.
+    for url, result in probe_in_order(variants, probe_dims, skip=beyond_cap):
+        if result is None:
             continue
+        got = accept(url, result)
+        if got:
+            return got
     return None, None, None
 
 # ------------------------- Google/DDG image search ---------------------------
 
-def google_image_search_any(title: str, max_results: int = 40) -> List[str]:
+# Multiple regex patterns to extract image URLs
+_GOOGLE_PATTERNS = [re.compile(p, re.I) for p in (
+    r'"ou":"([^"]+)"',  # Original URL in new format
+    r'imgurl=([^&]+)',  # Classic imgurl format
+    r'"src":"([^"]+\.(?:jpg|jpeg|png|webp)[^"]*)"',  # Direct src URLs
+    r'https?://[^"\s<>]+\.(?:jpg|jpeg|png|webp)(?:\?[^"\s<>]*)?',  # Any direct image URLs
+    r'"url":"([^"]+\.(?:jpg|jpeg|png|webp)[^"]*)"',  # Alternative URL format
+)]
+
+
+def google_image_search_any(title: str, max_results: int = 40, seen: Optional[set] = None) -> List[str]:
+    """``seen`` holds URLs already collected (shared across sources); new ones are added to it."""
+    seen = set() if seen is None else seen
     urls = []
     
-    # Multiple search strategies with different queries
-    search_terms = [
-        f'"{title}" movie wallpaper landscape',
+    # One large-and-wide query normally fills the list on its own; the results of
+    # near-identical queries overlap heavily, so they are only tried when it falls short
+    primary = f'"{title}" movie landscape wallpaper'
+    broader = f'{title} movie wallpaper'
+    # Only used if the primary query found nothing at all (blocked or odd title)
+    fallback_terms = [
         f'"{title}" film background landscape',
         f'"{title}" movie poster landscape horizontal',
         f'"{title}" movie scene landscape',
         f'"{title}" film still landscape',
         f'"{title}" movie backdrop',
-        f'{title} movie wallpaper',
         f'{title} film landscape',
         f'"{title}" movie horizontal',
     ]
     
-    for query in search_terms:
-        # Try both regular search and image search
-        search_urls = [
-            f"https://www.google.com/search?q={urllib.parse.quote(query)}&tbm=isch&tbs=isz:l,iar:w",
-            f"https://www.google.com/search?q={urllib.parse.quote(query)}&tbm=isch&tbs=isz:m,iar:w",
-        ]
-        
-        for search_url in search_urls:
-            try:
-                r = get(search_url, stream=False, timeout=30)
-                html_text = r.text
-                
-                # Debug: Save a sample of the HTML to see what we're getting
-                if not urls and query == search_terms[0]:
-                    print(f"Sample HTML length: {len(html_text)} chars")
-                    if "Our systems have detected unusual traffic" in html_text:
-                        print("WARNING: Google has detected unusual traffic and may be blocking requests")
-                
-                # Multiple regex patterns to extract image URLs
-                patterns = [
-                    r'"ou":"([^"]+)"',  # Original URL in new format
-                    r'imgurl=([^&]+)',  # Classic imgurl format
-                    r'"src":"([^"]+\.(?:jpg|jpeg|png|webp)[^"]*)"',  # Direct src URLs
-                    r'https?://[^"\s<>]+\.(?:jpg|jpeg|png|webp)(?:\?[^"\s<>]*)?',  # Any direct image URLs
-                    r'"url":"([^"]+\.(?:jpg|jpeg|png|webp)[^"]*)"',  # Alternative URL format
-                ]
-                
-                for pattern in patterns:
-                    matches = re.findall(pattern, html_text, flags=re.I)
-                    for match in matches:
-                        try:
-                            decoded_url = urllib.parse.unquote(html.unescape(match))
-                            # Skip thumbnails and cached images
-                            if any(host in decoded_url.lower() for host in 
-                                  ("gstatic.com", "googleusercontent.com", "encrypted-tbn0", 
-                                   "ggpht.com", "blogger.com", "bp.blogspot.com")):
-                                continue
-                            # Skip very small or obviously thumbnail URLs
-                            if any(thumb in decoded_url.lower() for thumb in 
-                                  ("thumb", "small", "mini", "icon", "avatar", "profile")):
-                                continue
-                            if decoded_url.startswith('http') and decoded_url not in urls:
-                                urls.append(decoded_url)
-                        except Exception:
+    def search(query: str) -> None:
+        search_url = f"https://www.google.com/search?q={urllib.parse.quote(query)}&tbm=isch&tbs=isz:l,iar:w"
+        try:
+            r = get(search_url, stream=False, timeout=30, throttle=True)
+            html_text = r.text
+            
+            # Debug: Save a sample of the HTML to see what we're getting
+            if query == primary:
+                print(f"Sample HTML length: {len(html_text)} chars")
+                if "Our systems have detected unusual traffic" in html_text:
+                    print("WARNING: Google has detected unusual traffic and may be blocking requests")
+            
+            for pattern in _GOOGLE_PATTERNS:
+                if len(urls) >= max_results:
+                    break
+                matches = pattern.findall(html_text)
+                for match in matches:
+                    if len(urls) >= max_results:
+                        break
+                    try:
+                        decoded_url = urllib.parse.unquote(html.unescape(match))
+                        # Skip thumbnails and cached images
+                        if any(host in decoded_url.lower() for host in 
+                              ("gstatic.com", "googleusercontent.com", "encrypted-tbn0", 
+                               "ggpht.com", "blogger.com", "bp.blogspot.com")):
                             continue
-                            
-            except Exception as e:
-                print(f"Google search failed for '{query}': {e}")
-                continue
-                
-            # Don't overwhelm the search - limit per query
+                        # Skip very small or obviously thumbnail URLs
+                        if any(thumb in decoded_url.lower() for thumb in 
+                              ("thumb", "small", "mini", "icon", "avatar", "profile")):
+                            continue
+                        if decoded_url.startswith('http') and decoded_url not in seen:
+                            seen.add(decoded_url)
+                            urls.append(decoded_url)
+                    except Exception:
+                        continue
+                        
+        except Exception as e:
+            print(f"Google search failed for '{query}': {e}")
+    
+    search(primary)
+    if not urls:
+        for query in fallback_terms:
             if len(urls) >= max_results:
                 break
-        
-        if len(urls) >= max_results:
-            break
+            search(query)
+    elif len(urls) < min(20, max_results):
+        search(broader)
     
     print(f"Google search extracted {len(urls)} URLs")
     return urls[:max_results]
 
 
-def ddg_image_search_any(title: str, max_results: int = 40) -> List[str]:
+# html.duckduckgo.com serves the no-JS results page directly (duckduckgo.com/html redirects to it)
+DDG_URL = "https://html.duckduckgo.com/html/"
+_DDG_IMG_RE = re.compile(r'https?://[^"\s]+\.(?:jpg|jpeg|png|webp)', re.I)
+# Thumbnail/proxy hosts; host names never contain HTML entities, so this can run on the raw match
+_DDG_SKIP_RE = re.compile(r"gstatic\.com|googleusercontent\.com|encrypted-tbn0|duckduckgo\.com", re.I)
+
+
+def ddg_image_search_any(title: str, max_results: int = 40, seen: Optional[set] = None) -> List[str]:
+    seen = set() if seen is None else seen
     search_terms = [
         f'"{title}" movie wallpaper landscape',
         f'"{title}" film background',
@@ -304,20 +925,21 @@ def ddg_image_search_any(title: str, max_results: int = 40) -> List[str]:
     
     urls = []
     for query in search_terms:
+        if len(urls) >= max_results:
+            break
         try:
-            r = get("https://duckduckgo.com/html/?" + urllib.parse.urlencode({"q": query}), stream=False)
+            r = get(DDG_URL + "?" + urllib.parse.urlencode({"q": query}), stream=False, throttle=True)
             html_text = r.text
-            found_urls = re.findall(r'https?://[^"\s]+\.(?:jpg|jpeg|png|webp)', html_text, flags=re.I)
-            for u in found_urls:
-                decoded_url = html.unescape(u)
-                if any(host in decoded_url.lower() for host in 
-                      ("gstatic.com", "googleusercontent.com", "encrypted-tbn0", "duckduckgo.com")):
+            for u in _DDG_IMG_RE.findall(html_text):
+                if len(urls) >= max_results:
+                    break
+                # Reject before unescaping so skipped matches cost one C-level scan
+                if _DDG_SKIP_RE.search(u):
                     continue
-                if decoded_url not in urls:
+                decoded_url = html.unescape(u)
+                if decoded_url not in seen:
+                    seen.add(decoded_url)
                     urls.append(decoded_url)
-            
-            if len(urls) >= max_results:
-                break
                 
         except Exception as e:
             print(f"DuckDuckGo search failed for '{query}': {e}")
@@ -327,8 +949,16 @@ def ddg_image_search_any(title: str, max_results: int = 40) -> List[str]:
     return urls[:max_results]
 
 
-def bing_image_search_any(title: str, max_results: int = 40) -> List[str]:
+# Bing specific patterns - improved to handle JSON properly
+_BING_PATTERNS = [re.compile(p, re.I) for p in (
+    r'"murl":"([^"]+\.(?:jpg|jpeg|png|webp)[^"]*)"',  # Media URL with image extension
+    r'"imgurl":"([^"]+\.(?:jpg|jpeg|png|webp)[^"]*)"',  # Image URL with image extension
+)]
+
+
+def bing_image_search_any(title: str, max_results: int = 40, seen: Optional[set] = None) -> List[str]:
     """Bing image search as a fallback option"""
+    seen = set() if seen is None else seen
     urls = []
     search_terms = [
         f'"{title}" movie wallpaper landscape',
@@ -338,20 +968,20 @@ def bing_image_search_any(title: str, max_results: int = 40) -> List[str]:
     ]
     
     for query in search_terms:
+        if len(urls) >= max_results:
+            break
         try:
             search_url = f"https://www.bing.com/images/search?q={urllib.parse.quote(query)}&qft=+filterui:imagesize-large+filterui:aspect-wide"
-            r = get(search_url, stream=False, timeout=30)
+            r = get(search_url, stream=False, timeout=30, throttle=True)
             html_text = r.text
             
-            # Bing specific patterns - improved to handle JSON properly
-            patterns = [
-                r'"murl":"([^"]+\.(?:jpg|jpeg|png|webp)[^"]*)"',  # Media URL with image extension
-                r'"imgurl":"([^"]+\.(?:jpg|jpeg|png|webp)[^"]*)"',  # Image URL with image extension
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, html_text, flags=re.I)
+            for pattern in _BING_PATTERNS:
+                if len(urls) >= max_results:
+                    break
+                matches = pattern.findall(html_text)
                 for match in matches:
+                    if len(urls) >= max_results:
+                        break
                     try:
                         # Decode JSON-escaped URL
                         decoded_url = match.replace('\\/', '/').replace('\\u0026', '&')
@@ -363,7 +993,8 @@ def bing_image_search_any(title: str, max_results: int = 40) -> List[str]:
                             continue
                             
                         # Only add valid HTTP(S) URLs
-                        if decoded_url.startswith('http') and decoded_url not in urls:
+                        if decoded_url.startswith('http') and decoded_url not in seen:
+                            seen.add(decoded_url)
                             urls.append(decoded_url)
                     except Exception:
                         continue
@@ -371,9 +1002,6 @@ def bing_image_search_any(title: str, max_results: int = 40) -> List[str]:
         except Exception as e:
             print(f"Bing search failed for '{query}': {e}")
             continue
-            
-        if len(urls) >= max_results:
-            break
     
     print(f"Bing search extracted {len(urls)} URLs")
     return urls[:max_results]
@@ -453,7 +1081,7 @@ def try_movie_databases(title: str) -> List[str]:
         print(f"TMDB search failed: {e}")
     
     # Clean title for URL use
-    clean_title = re.sub(r'[^\w\s-]', '', title).strip()
+    clean_title = _NON_SLUG.sub('', title).strip()
     url_title = clean_title.replace(' ', '-').lower()
     
     # Try some direct wallpaper URLs (these often work)
@@ -467,10 +1095,10 @@ def try_movie_databases(title: str) -> List[str]:
     print(f"Movie database search found {len(urls)} potential URLs")
     return urls
 
-def score_landscape(candidate_bytes: bytes, w: int, h: int, poster_lab: Tuple[float,float,float]) -> float:
+def score_landscape(candidate: Union[bytes, BinaryIO], w: int, h: int, poster_lab: Tuple[float,float,float]) -> float:
     # Lower score is better
     try:
-        lab = avg_color_lab(candidate_bytes)
+        lab = avg_color_lab(candidate)
         de = delta_e_cie76(lab, poster_lab)
     except Exception:
         de = 50.0  # Reduced penalty for color matching failure
@@ -486,41 +1114,42 @@ def score_landscape(candidate_bytes: bytes, w: int, h: int, poster_lab: Tuple[fl
     return score
 
 
-def fetch_best_landscape_any(title: str, poster_lab: Tuple[float,float,float], min_width: int = MIN_LANDSCAPE_WIDTH) -> Tuple[Optional[bytes], Optional[str]]:
+def fetch_best_landscape_any(title: str, dest_stem: str, poster_lab: Tuple[float,float,float], min_width: int = MIN_LANDSCAPE_WIDTH) -> Tuple[Optional[str], Optional[str]]:
+    """Save the best-scoring landscape to ``dest_stem`` + ext; returns ``(path, ext)``."""
     print(f"Searching for landscape images for '{title}'...")
     
-    # Try multiple sources in order of reliability
-    probe: List[str] = []
-    
-    # Try movie databases with APIs first (most reliable)
-    movie_db_urls = try_movie_databases(title)
-    probe.extend(movie_db_urls)
-    
-    # Try free image APIs
-    if len(probe) < 10:
-        api_urls = try_free_image_apis(title)
-        probe.extend(api_urls)
-    
-    # Try search engines as fallback
-    if len(probe) < 20:
-        google_urls = google_image_search_any(title, 30)
-        probe.extend(google_urls)
-    
-    if len(probe) < 30:
-        ddg_urls = ddg_image_search_any(title, 20)
-        probe.extend(ddg_urls)
-    
-    if len(probe) < 40:
-        bing_urls = bing_image_search_any(title, 20)
-        probe.extend(bing_urls)
-
-    # Deduplicate while preserving order
-    seen = set()
+    # Try multiple sources in order of reliability. ``seen`` is shared with the
+    # search engines so each source only returns URLs nobody found before it.
+    seen: set = set()
     ordered: List[str] = []
-    for u in probe:
-        if u not in seen:
-            seen.add(u)
-            ordered.append(u)
+
+    def add(urls: List[str]) -> None:
+        for u in urls:
+            if u not in seen:
+                seen.add(u)
+                ordered.append(u)
+
+    # Try movie databases with APIs first (most reliable)
+    add(try_movie_databases(title))
+    # TMDB backdrops are official 16:9 art that outscores anything the other
+    # sources turn up, so with a few of them no other source is worth a request
+    tmdb_backdrops = sum(TMDB_IMAGE_HOST in u for u in ordered)
+    if tmdb_backdrops >= TMDB_ENOUGH:
+        print(f"TMDB returned {tmdb_backdrops} backdrops, skipping the other image sources")
+    else:
+        # Try free image APIs
+        if len(ordered) < 10:
+            add(try_free_image_apis(title))
+        
+        # Try search engines as fallback
+        if len(ordered) < 20:
+            ordered.extend(google_image_search_any(title, 30, seen))
+        
+        if len(ordered) < 30:
+            ordered.extend(ddg_image_search_any(title, 20, seen))
+        
+        if len(ordered) < 40:
+            ordered.extend(bing_image_search_any(title, 20, seen))
 
     print(f"Total unique URLs to check: {len(ordered)}")
     
@@ -528,52 +1157,102 @@ def fetch_best_landscape_any(title: str, poster_lab: Tuple[float,float,float], m
         print("No URLs found from any source. This might indicate connectivity issues or rate limiting.")
         return None, None
     
-    best = None  # (score, data, ext)
+    best = None  # (score, spooled file, ext, url)
     checked = 0
     valid_candidates = 0
-    
-    for i, url in enumerate(ordered):
-        if i % 10 == 0 and i > 0:
-            print(f"Checked {i}/{len(ordered)} URLs, found {valid_candidates} valid candidates...")
-            
+    failures = 0
+    # Set once a winner is picked; workers already running check it between steps
+    # so they stop downloading/decoding for a search that is over
+    done = threading.Event()
+
+    def fetch_candidate(url: str) -> Tuple[int, int, Optional[BinaryIO], Optional[str], float]:
+        # Probe the header first; only candidates that pass the gates are downloaded,
+        # and then into a spooled temp file rather than a bytes object
+        w, h, _ = probe_dims(url)
+        # More lenient size requirements; allow some portrait images if they're close to landscape
+        if w < min_width or w / h < 1.2 or done.is_set():
+            return w, h, None, None, math.inf
+        spool, ct = fetch_to_spool(url)
+        if done.is_set():
+            spool.close()
+            return w, h, None, None, math.inf
+        # Scored here too: Pillow releases the GIL while decoding, so the decodes
+        # run in parallel with each other and with the other workers' downloads
         try:
-            data, w, h, ct = fetch_image_and_dims(url)
-        except Exception as e:
-            if i < 3:  # Show first few errors for debugging
-                print(f"Failed to fetch {url[:80]}...: {str(e)[:100]}")
-            continue
-            
-        checked += 1
-        
-        # More lenient size requirements
-        if w < min_width:
-            continue
-            
-        # Allow some portrait images if they're close to landscape
-        ar = w / h
-        if ar < 1.2:  # Still prefer landscape but allow closer to square
-            continue
-            
-        valid_candidates += 1
-        score = score_landscape(data, w, h, poster_lab)
-        
-        if best is None or score < best[0]:
-            ext = infer_ext(url, ct)
-            best = (score, data, ext)
-            print(f"New best candidate: {w}x{h}, aspect ratio: {ar:.2f}, score: {score:.2f}")
-        
-        # If we found a really good candidate, don't search forever
-        if best and best[0] < 0.3 and valid_candidates >= 2:
-            print("Found a good candidate, stopping search early.")
-            break
-            
-        if checked >= 100:  # Safety cap
-            break
+            score = score_landscape(spool, w, h, poster_lab)
+        except BaseException:
+            spool.close()
+            raise
+        if TMDB_IMAGE_HOST in url:
+            score -= TMDB_BONUS
+        spool.seek(0)
+        return w, h, spool, ct, score
+
+    # Candidates are fetched and scored in parallel; this loop only keeps the best
+    pool = ThreadPoolExecutor(max_workers=LANDSCAPE_WORKERS)
+    futures = {pool.submit(fetch_candidate, url): url for url in ordered}
+    consumed = set()
+
+    def discard(fut) -> None:
+        # A result that lands after we stopped listening: close its temp file
+        if not fut.cancelled() and fut.exception() is None and fut.result()[2] is not None:
+            fut.result()[2].close()
+
+    try:
+        for i, fut in enumerate(as_completed(futures)):
+            if i % 10 == 0 and i > 0:
+                print(f"Checked {i}/{len(ordered)} URLs, found {valid_candidates} valid candidates...")
+
+            consumed.add(fut)
+            url = futures[fut]
+            try:
+                w, h, spool, ct, score = fut.result()
+            except Exception as e:
+                failures += 1
+                if failures <= 3:  # Show first few errors for debugging
+                    print(f"Failed to fetch {url[:80]}...: {str(e)[:100]}")
+                continue
+
+            checked += 1
+            if spool is None:
+                continue
+
+            ar = w / h
+            valid_candidates += 1
+
+            # Only the current best is kept; every other candidate is dropped immediately
+            if best is None or score < best[0]:
+                if best is not None:
+                    best[1].close()
+                ext = infer_ext(url, ct)
+                best = (score, spool, ext, url)
+                print(f"New best candidate: {w}x{h}, aspect ratio: {ar:.2f}, score: {score:.2f}")
+            else:
+                spool.close()
+
+            # If we found a really good candidate, don't search forever
+            if best and best[0] < 0.3 and valid_candidates >= 2:
+                print("Found a good candidate, stopping search early.")
+                break
+
+            if checked >= 100:  # Safety cap
+                break
+    finally:
+        done.set()
+        for fut in futures:
+            if fut not in consumed and not fut.cancel():
+                fut.add_done_callback(discard)
+        pool.shutdown(wait=False)
 
     print(f"Checked {checked} images, found {valid_candidates} valid landscape candidates")
     
     if best:
-        return best[1], best[2]
+        # Only the winner is persisted, streamed from its spool into the store
+        _, spool, ext, url = best
+        with spool:
+            spool.seek(0)
+            path = store_chunks(iter(lambda: spool.read(DOWNLOAD_CHUNK), b""), url, ext, dest_stem)
+        return path, ext
     return None, None
 
 # --------------------------------- main -------------------------------------
@@ -596,12 +1275,15 @@ def extract_actual_image_url(url):
         return url
 
 def main():
+    # Network setup that doesn't depend on the answers overlaps with the user typing
+    prewarm_dns()
+
     title = input("Enter film title: ").strip()
     if not title:
         print("No title provided.")
         sys.exit(1)
 
-    clean = sanitize_filename(re.sub(r"\s+\(.*?\)$", "", title))
+    clean = sanitize_filename(_TRAILING_PAREN.sub("", title))
 
     # Always save to the specific project directories, regardless of where script is run
     poster_dir = "/Users/fredparsons/Documents/Side Projects/UI Working/media/Images/Posters"
@@ -610,15 +1292,19 @@ def main():
     os.makedirs(poster_dir, exist_ok=True)
     os.makedirs(thumbnail_dir, exist_ok=True)
 
-    # Poster (IMDb)
-    poster_bytes, poster_ext, poster_lab = fetch_poster_imdb(title, min_height=MIN_POSTER_HEIGHT)
-    if poster_bytes is None or poster_lab is None:
-        print("Could not find an IMDb poster ≥2000px for this title.")
-    else:
-        poster_path = os.path.join(poster_dir, f"{clean} - poster{poster_ext}")
-        with open(poster_path, "wb") as f:
-            f.write(poster_bytes)
-        print(f"Saved: {poster_path}")
+    # Poster (IMDb) - starts as soon as the title is known (suggestion lookup first), so it
+    # runs while the landscape URL is being typed and downloaded. A daemon thread, not an
+    # executor: Ctrl-C must not wait for the poster sweep before the process can exit
+    poster_result = {}
+
+    def poster_job() -> None:
+        try:
+            poster_result["value"] = fetch_poster_imdb(title, os.path.join(poster_dir, f"{clean} - poster"), min_height=MIN_POSTER_HEIGHT)
+        except BaseException as e:
+            poster_result["error"] = e
+
+    poster_thread = threading.Thread(target=poster_job, daemon=True)
+    poster_thread.start()
 
     # Landscape image - ask for direct URL
     landscape_url = input("Enter landscape image URL (or press Enter to skip): ").strip()
@@ -629,24 +1315,19 @@ def main():
             actual_url = extract_actual_image_url(landscape_url)
             print(f"Downloading landscape image from: {actual_url}")
             
-            data, w, h, ct = fetch_image_and_dims(actual_url)
+            w, h, _ = probe_dims(actual_url)
+            land_stem = os.path.join(thumbnail_dir, f"{clean} - 16x9")
             
             # Verify it's reasonably landscape-oriented
             ar = w / h
             if ar >= 1.2:  # At least somewhat landscape
-                land_ext = infer_ext(actual_url, ct)
-                land_path = os.path.join(thumbnail_dir, f"{clean} - 16x9{land_ext}")
-                with open(land_path, "wb") as f:
-                    f.write(data)
+                land_path, _ = download_to(actual_url, land_stem)
                 print(f"Saved: {land_path} ({w}x{h}, aspect ratio: {ar:.2f})")
             else:
                 print(f"Warning: Image is not landscape-oriented ({w}x{h}, aspect ratio: {ar:.2f})")
                 save_anyway = input("Save anyway? (y/n): ").strip().lower()
                 if save_anyway == 'y':
-                    land_ext = infer_ext(actual_url, ct)
-                    land_path = os.path.join(thumbnail_dir, f"{clean} - 16x9{land_ext}")
-                    with open(land_path, "wb") as f:
-                        f.write(data)
+                    land_path, _ = download_to(actual_url, land_stem)
                     print(f"Saved: {land_path}")
                 else:
                     print("Landscape image not saved.")
@@ -656,6 +1337,15 @@ def main():
     else:
         print("No landscape URL provided, skipping landscape image.")
 
+    poster_thread.join()
+    if "error" in poster_result:
+        raise poster_result["error"]
+    poster_path, _, poster_lab = poster_result["value"]
+    if poster_path is None or poster_lab is None:
+        print("Could not find an IMDb poster ≥2000px for this title.")
+    else:
+        print(f"Saved: {poster_path}")
+
     print("Done.")
 
 if __name__ == "__main__":
@@ -663,4 +1353,7 @@ if __name__ == "__main__":
         main()
     except KeyboardInterrupt:
         print("\nCancelled.")
-        sys.exit(130)
+        # sys.exit would join the probe executors' worker threads (non-daemon by
+        # design in concurrent.futures), i.e. wait out requests nobody needs now
+        sys.stdout.flush()
+        os._exit(130)